@@ -15,12 +15,45 @@ Usage:
     python server.py --config config.yaml
 """
 
+import asyncio
 import os
-import json
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+
+import aiohttp
+import orjson
 from github import Github, GithubException
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Most responses kept in the ETag cache; the oldest entry is evicted first
+ETAG_CACHE_SIZE = 1024
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 20, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title state author { login } createdAt updatedAt url
+        baseRefName headRefName mergeable merged additions deletions changedFiles
+        comments { totalCount } reviewThreads { totalCount }
+      }
+    }
+  }
+}
+"""
+
+# REST-style state filter -> GraphQL PullRequestState values
+PR_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": ["OPEN", "CLOSED", "MERGED"],
+}
+
+# GraphQL MergeableState -> REST-style mergeable flag
+PR_MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False}
+
 
 @dataclass
 class GitHubMCPServer:
@@ -28,11 +61,123 @@ class GitHubMCPServer:
 
     def __init__(self, access_token: str):
         self.github = Github(access_token)
-        self.user = self.github.get_user()
+        self._requester = self.github._Github__requester
+        self._access_token = access_token
+
+        # Read paths use a non-blocking client; created lazily on the running loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # key -> (etag, expires_at, payload)
+        self._etag_cache: Dict[str, Tuple[str, float, Any]] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=GITHUB_API_URL,
+                headers={
+                    "Authorization": f"token {self._access_token}",
+                    "Accept": "application/vnd.github+json",
+                },
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _repo(self, repo_name: str):
+        """
+        Return a repository handle for write calls.
+
+        The handle is lazy, so it costs no GET /repos/{name} round trip;
+        PyGithub only fetches repository attributes if they are read.
+        """
+        return self.github.get_repo(repo_name, lazy=True)
+
+    async def _cached_get(self, url: str, key: str, ttl: int = 60, parameters: Dict = None) -> Any:
+        """
+        GET a REST endpoint through a TTL + ETag cache.
+
+        Fresh entries are served locally. Stale entries are revalidated with
+        If-None-Match; a 304 reuses the cached payload and does not count
+        against the primary rate limit.
+        """
+        now = time.monotonic()
+        cached = self._etag_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[2]
+
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        try:
+            async with self._get_session().get(url, params=parameters, headers=headers) as response:
+                if response.status == 304 and cached:
+                    data = cached[2]
+                    etag = cached[0]
+                else:
+                    data = await self._read_json(response)
+                    if response.status >= 400:
+                        raise GithubException(response.status, data, dict(response.headers))
+                    etag = response.headers.get("ETag")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise GithubException(0, {"message": f"Request to {url} failed: {e}"}) from e
+
+        if etag:
+            self._cache_put(key, (etag, now + ttl, data))
+        return data
+
+    def _cache_put(self, key: str, entry: Tuple[str, float, Any]):
+        """Store a cache entry, evicting the oldest once ETAG_CACHE_SIZE is reached"""
+        # Re-insert so refreshed entries move to the end of the eviction order
+        self._etag_cache.pop(key, None)
+        if len(self._etag_cache) >= ETAG_CACHE_SIZE:
+            del self._etag_cache[next(iter(self._etag_cache))]
+        self._etag_cache[key] = entry
+
+    def _invalidate_repo(self, repo_name: str):
+        """
+        Drop cached reads a write to repo_name may have changed.
+
+        Covers the issue lists and the repository info (its open issue
+        count includes pull requests). list_pull_requests uses GraphQL and
+        is not cached.
+        """
+        prefix = f"list_issues:{repo_name}:"
+        stale = [
+            key for key in self._etag_cache
+            if key.startswith(prefix) or key == f"get_repository_info:{repo_name}"
+        ]
+        for key in stale:
+            del self._etag_cache[key]
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body, reporting non-JSON bodies as GithubException"""
+        body = await response.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # e.g. an HTML error page from a 5xx
+            message = body[:512].decode("utf-8", errors="replace")
+            raise GithubException(response.status, {"message": message}, dict(response.headers)) from None
+
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict:
+        """Run a GraphQL query and return its data"""
+        payload = orjson.dumps({"query": query, "variables": variables})
+        headers = {"Content-Type": "application/json"}
+        try:
+            async with self._get_session().post("/graphql", data=payload, headers=headers) as response:
+                data = await self._read_json(response)
+                if response.status >= 400 or data.get("errors"):
+                    raise GithubException(response.status, data, dict(response.headers))
+                return data["data"]
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise GithubException(0, {"message": f"GraphQL request failed: {e}"}) from e
 
     # ========== Repository Operations ==========
 
-    def list_repositories(self, org: str = None, visibility: str = "all") -> List[Dict]:
+    async def list_repositories(self, org: str = None, visibility: str = "all") -> List[Dict]:
         """
         List repositories for user or organization.
 
@@ -48,26 +193,34 @@ class GitHubMCPServer:
         """
         try:
             if org:
-                repos = self.github.get_organization(org).get_repos(type=visibility)
+                repos = await self._cached_get(
+                    f"/orgs/{org}/repos",
+                    key=f"list_repositories:{org}:{visibility}",
+                    parameters={"type": visibility, "per_page": 50},
+                )
             else:
-                repos = self.user.get_repos(visibility=visibility)
+                repos = await self._cached_get(
+                    "/user/repos",
+                    key=f"list_repositories::{visibility}",
+                    parameters={"visibility": visibility, "per_page": 50},
+                )
 
             return [{
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "private": repo.private,
-                "url": repo.html_url,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "language": repo.language,
-                "updated_at": repo.updated_at.isoformat()
-            } for repo in repos[:50]]  # Limit to 50
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo["description"],
+                "private": repo["private"],
+                "url": repo["html_url"],
+                "stars": repo["stargazers_count"],
+                "forks": repo["forks_count"],
+                "language": repo["language"],
+                "updated_at": repo["updated_at"]
+            } for repo in repos]
 
         except GithubException as e:
             return {"error": str(e), "status_code": e.status}
 
-    def get_repository_info(self, repo_name: str) -> Dict:
+    async def get_repository_info(self, repo_name: str) -> Dict:
         """
         Get detailed repository information.
 
@@ -80,24 +233,24 @@ class GitHubMCPServer:
         RBAC: Requires 'repo:read' permission
         """
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = await self._cached_get(f"/repos/{repo_name}", key=f"get_repository_info:{repo_name}")
 
             return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "private": repo.private,
-                "url": repo.html_url,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "watchers": repo.watchers_count,
-                "language": repo.language,
-                "topics": repo.get_topics(),
-                "created_at": repo.created_at.isoformat(),
-                "updated_at": repo.updated_at.isoformat(),
-                "default_branch": repo.default_branch,
-                "open_issues": repo.open_issues_count,
-                "license": repo.license.name if repo.license else None,
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo["description"],
+                "private": repo["private"],
+                "url": repo["html_url"],
+                "stars": repo["stargazers_count"],
+                "forks": repo["forks_count"],
+                "watchers": repo["watchers_count"],
+                "language": repo["language"],
+                "topics": repo.get("topics", []),
+                "created_at": repo["created_at"],
+                "updated_at": repo["updated_at"],
+                "default_branch": repo["default_branch"],
+                "open_issues": repo["open_issues_count"],
+                "license": repo["license"]["name"] if repo.get("license") else None,
             }
 
         except GithubException as e:
@@ -105,7 +258,7 @@ class GitHubMCPServer:
 
     # ========== Issue Operations ==========
 
-    def list_issues(self, repo_name: str, state: str = "open", labels: List[str] = None) -> List[Dict]:
+    async def list_issues(self, repo_name: str, state: str = "open", labels: List[str] = None) -> List[Dict]:
         """
         List issues for a repository.
 
@@ -120,22 +273,28 @@ class GitHubMCPServer:
         RBAC: Requires 'issues:read' permission
         """
         try:
-            repo = self.github.get_repo(repo_name)
-            issues = repo.get_issues(state=state, labels=labels or [])
+            parameters = {"state": state, "per_page": 20}
+            if labels:
+                parameters["labels"] = ",".join(labels)
+            issues = await self._cached_get(
+                f"/repos/{repo_name}/issues",
+                key=f"list_issues:{repo_name}:{state}:{parameters.get('labels', '')}",
+                parameters=parameters,
+            )
 
             return [{
-                "number": issue.number,
-                "title": issue.title,
-                "state": issue.state,
-                "author": issue.user.login,
-                "labels": [label.name for label in issue.labels],
-                "assignees": [assignee.login for assignee in issue.assignees],
-                "created_at": issue.created_at.isoformat(),
-                "updated_at": issue.updated_at.isoformat(),
-                "url": issue.html_url,
-                "body": issue.body[:500] if issue.body else None,  # Truncate
-                "comments": issue.comments
-            } for issue in issues[:20]]  # Limit to 20
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"],
+                "author": issue["user"]["login"],
+                "labels": [label["name"] for label in issue["labels"]],
+                "assignees": [assignee["login"] for assignee in issue["assignees"]],
+                "created_at": issue["created_at"],
+                "updated_at": issue["updated_at"],
+                "url": issue["html_url"],
+                "body": issue["body"][:500] if issue["body"] else None,  # Truncate
+                "comments": issue["comments"]
+            } for issue in issues]
 
         except GithubException as e:
             return {"error": str(e), "status_code": e.status}
@@ -158,8 +317,9 @@ class GitHubMCPServer:
         Audit: Logs issue creation
         """
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._repo(repo_name)
             issue = repo.create_issue(title=title, body=body, labels=labels or [])
+            self._invalidate_repo(repo_name)
 
             return {
                 "number": issue.number,
@@ -188,27 +348,23 @@ class GitHubMCPServer:
         Approval: Required for closing issues
         """
         try:
-            repo = self.github.get_repo(repo_name)
-            issue = repo.get_issue(issue_number)
-
-            # Update fields
-            if "title" in kwargs:
-                issue.edit(title=kwargs["title"])
-            if "body" in kwargs:
-                issue.edit(body=kwargs["body"])
-            if "state" in kwargs:
-                issue.edit(state=kwargs["state"])
-            if "labels" in kwargs:
-                issue.set_labels(*kwargs["labels"])
-            if "assignees" in kwargs:
-                issue.edit(assignees=kwargs["assignees"])
+            # Send every field in a single PATCH
+            payload = {
+                field: kwargs[field]
+                for field in ("title", "body", "state", "labels", "assignees")
+                if field in kwargs
+            }
+            _, issue = self._requester.requestJsonAndCheck(
+                "PATCH", f"/repos/{repo_name}/issues/{issue_number}", input=payload
+            )
+            self._invalidate_repo(repo_name)
 
             return {
-                "number": issue.number,
-                "title": issue.title,
-                "state": issue.state,
-                "updated_at": issue.updated_at.isoformat(),
-                "url": issue.html_url
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"],
+                "updated_at": issue["updated_at"],
+                "url": issue["html_url"]
             }
 
         except GithubException as e:
@@ -216,7 +372,7 @@ class GitHubMCPServer:
 
     # ========== Pull Request Operations ==========
 
-    def list_pull_requests(self, repo_name: str, state: str = "open") -> List[Dict]:
+    async def list_pull_requests(self, repo_name: str, state: str = "open") -> List[Dict]:
         """
         List pull requests for a repository.
 
@@ -230,27 +386,34 @@ class GitHubMCPServer:
         RBAC: Requires 'pr:read' permission
         """
         try:
-            repo = self.github.get_repo(repo_name)
-            prs = repo.get_pulls(state=state)
+            # One GraphQL round trip returns the merge/diff stats that the
+            # REST list endpoint omits (first 20, newest first)
+            owner, name = repo_name.split("/", 1)
+            data = await self._graphql(PULL_REQUESTS_QUERY, {
+                "owner": owner,
+                "name": name,
+                "states": PR_STATES.get(state, PR_STATES["all"]),
+            })
+            prs = data["repository"]["pullRequests"]["nodes"]
 
             return [{
-                "number": pr.number,
-                "title": pr.title,
-                "state": pr.state,
-                "author": pr.user.login,
-                "created_at": pr.created_at.isoformat(),
-                "updated_at": pr.updated_at.isoformat(),
-                "url": pr.html_url,
-                "base": pr.base.ref,
-                "head": pr.head.ref,
-                "mergeable": pr.mergeable,
-                "merged": pr.merged,
-                "additions": pr.additions,
-                "deletions": pr.deletions,
-                "changed_files": pr.changed_files,
-                "comments": pr.comments,
-                "review_comments": pr.review_comments
-            } for pr in prs[:20]]  # Limit to 20
+                "number": pr["number"],
+                "title": pr["title"],
+                "state": "open" if pr["state"] == "OPEN" else "closed",
+                "author": pr["author"]["login"] if pr["author"] else None,
+                "created_at": pr["createdAt"],
+                "updated_at": pr["updatedAt"],
+                "url": pr["url"],
+                "base": pr["baseRefName"],
+                "head": pr["headRefName"],
+                "mergeable": PR_MERGEABLE.get(pr["mergeable"]),
+                "merged": pr["merged"],
+                "additions": pr["additions"],
+                "deletions": pr["deletions"],
+                "changed_files": pr["changedFiles"],
+                "comments": pr["comments"]["totalCount"],
+                "review_comments": pr["reviewThreads"]["totalCount"]
+            } for pr in prs]
 
         except GithubException as e:
             return {"error": str(e), "status_code": e.status}
@@ -280,8 +443,9 @@ class GitHubMCPServer:
         Approval: Required for main/master branches
         """
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._repo(repo_name)
             pr = repo.create_pull(title=title, body=body or "", head=head, base=base)
+            self._invalidate_repo(repo_name)
 
             return {
                 "number": pr.number,
@@ -296,7 +460,7 @@ class GitHubMCPServer:
 
     # ========== Code Search Operations ==========
 
-    def search_code(self, query: str, repo: str = None, language: str = None) -> List[Dict]:
+    async def search_code(self, query: str, repo: str = None, language: str = None) -> List[Dict]:
         """
         Search code across repositories.
 
@@ -319,22 +483,26 @@ class GitHubMCPServer:
             if language:
                 search_query += f" language:{language}"
 
-            results = self.github.search_code(query=search_query)
+            results = await self._cached_get(
+                "/search/code",
+                key=f"search_code:{search_query}",
+                parameters={"q": search_query, "per_page": 10},
+            )
 
             return [{
-                "name": item.name,
-                "path": item.path,
-                "repository": item.repository.full_name,
-                "url": item.html_url,
-                "score": item.score
-            } for item in results[:10]]  # Limit to 10
+                "name": item["name"],
+                "path": item["path"],
+                "repository": item["repository"]["full_name"],
+                "url": item["html_url"],
+                "score": item["score"]
+            } for item in results["items"]]
 
         except GithubException as e:
             return {"error": str(e), "status_code": e.status}
 
     # ========== User Operations ==========
 
-    def get_user_info(self, username: str = None) -> Dict:
+    async def get_user_info(self, username: str = None) -> Dict:
         """
         Get user information.
 
@@ -347,20 +515,21 @@ class GitHubMCPServer:
         RBAC: Requires 'user:read' permission
         """
         try:
-            user = self.github.get_user(username) if username else self.user
+            url = f"/users/{username}" if username else "/user"
+            user = await self._cached_get(url, key=f"get_user_info:{username or ''}")
 
             return {
-                "login": user.login,
-                "name": user.name,
-                "email": user.email,
-                "bio": user.bio,
-                "company": user.company,
-                "location": user.location,
-                "public_repos": user.public_repos,
-                "followers": user.followers,
-                "following": user.following,
-                "created_at": user.created_at.isoformat(),
-                "url": user.html_url
+                "login": user["login"],
+                "name": user["name"],
+                "email": user["email"],
+                "bio": user["bio"],
+                "company": user["company"],
+                "location": user["location"],
+                "public_repos": user["public_repos"],
+                "followers": user["followers"],
+                "following": user["following"],
+                "created_at": user["created_at"],
+                "url": user["html_url"]
             }
 
         except GithubException as e:
@@ -420,4 +589,5 @@ if __name__ == "__main__":
     print()
     print("Starting server...")
 
+    proxy.on_shutdown(github_server.close)
     proxy.start(host="0.0.0.0", port=8080)
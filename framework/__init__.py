@@ -3,7 +3,8 @@ Enterprise MCP Framework
 Production-grade security, observability, and governance for MCP servers
 """
 
-from .proxy.server import EnterpriseProxy
+from typing import TYPE_CHECKING
+
 from .config import (
     SecurityConfig,
     ObservabilityConfig,
@@ -12,6 +13,9 @@ from .config import (
     FrameworkConfig
 )
 
+if TYPE_CHECKING:
+    from .proxy.server import EnterpriseProxy
+
 __version__ = "0.1.0"
 
 __all__ = [
@@ -22,3 +26,18 @@ __all__ = [
     "CostConfig",
     "FrameworkConfig",
 ]
+
+
+def __getattr__(name: str):
+    # Import the proxy (and its middleware chain) only on first use, so
+    # importing a config class stays cheap
+    if name == "EnterpriseProxy":
+        from .proxy.server import EnterpriseProxy
+
+        globals()["EnterpriseProxy"] = EnterpriseProxy
+        return EnterpriseProxy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + ["EnterpriseProxy"])
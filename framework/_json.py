@@ -0,0 +1,45 @@
+"""
+JSON encoding shared across the framework
+
+Uses the fastest available backend: orjson (the "fast" extra), then
+ujson, then the standard library. dumps always returns UTF-8 bytes and
+loads accepts bytes or str.
+"""
+
+from typing import Any, Callable, Union
+
+loads: Callable[[Union[bytes, str]], Any]
+dumps: Callable[[Any], bytes]
+dumps_line: Callable[[Any], bytes]  # Encode obj as one newline-terminated line
+
+try:
+    import orjson
+
+    def _orjson_dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+    dumps_line = _orjson_dumps_line
+except ImportError:
+    try:
+        import ujson
+
+        def _ujson_dumps(obj: Any) -> bytes:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+        loads = ujson.loads
+        dumps = _ujson_dumps
+    except ImportError:
+        import json
+
+        def _json_dumps(obj: Any) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        loads = json.loads
+        dumps = _json_dumps
+
+    def _dumps_line(obj: Any) -> bytes:
+        return dumps(obj) + b"\n"
+
+    dumps_line = _dumps_line
@@ -23,7 +23,7 @@ class ComplianceTemplate(str, Enum):
     PCI_DSS = "pci_dss"
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfig:
     """Security layer configuration"""
 
@@ -48,8 +48,15 @@ class SecurityConfig:
     # Tenant Isolation (for multi-tenant)
     tenant_isolation: bool = False
 
+    # Layer toggle
+    enabled: bool = True
+
+    # Seconds an RBAC decision is reused; 0 disables decision caching.
+    # Appended last so existing positional arguments keep their meaning.
+    rbac_cache_ttl_seconds: float = 60.0
+
 
-@dataclass
+@dataclass(slots=True)
 class MetricsConfig:
     """Metrics configuration"""
     enabled: bool = True
@@ -58,7 +65,7 @@ class MetricsConfig:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TracingConfig:
     """Tracing configuration"""
     enabled: bool = True
@@ -67,7 +74,7 @@ class TracingConfig:
     sample_rate: float = 1.0  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration"""
     level: str = "INFO"  # DEBUG, INFO, WARN, ERROR
@@ -75,7 +82,7 @@ class LoggingConfig:
     output: str = "stdout"  # stdout, file, syslog
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservabilityConfig:
     """Observability layer configuration"""
 
@@ -86,8 +93,11 @@ class ObservabilityConfig:
     dashboard_enabled: bool = True
     dashboard_port: int = 3000
 
+    # Layer toggle
+    enabled: bool = True
+
 
-@dataclass
+@dataclass(slots=True)
 class ApprovalConfig:
     """Approval workflow configuration"""
     name: str
@@ -97,7 +107,7 @@ class ApprovalConfig:
     timeout_seconds: int = 3600  # 1 hour default
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditConfig:
     """Audit logging configuration"""
     enabled: bool = True
@@ -106,7 +116,7 @@ class AuditConfig:
     retention_days: int = 365  # 1 year default
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyConfig:
     """Policy engine configuration"""
     enabled: bool = True
@@ -114,7 +124,7 @@ class PolicyConfig:
     policy_dir: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceConfig:
     """Governance layer configuration"""
 
@@ -126,8 +136,11 @@ class GovernanceConfig:
     compliance_template: Optional[ComplianceTemplate] = None
     compliance_config: Dict[str, Any] = field(default_factory=dict)
 
+    # Layer toggle
+    enabled: bool = True
+
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Rate limiting configuration"""
     enabled: bool = True
@@ -136,7 +149,7 @@ class RateLimitConfig:
     per_user: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetConfig:
     """Budget configuration"""
     enabled: bool = True
@@ -145,7 +158,7 @@ class BudgetConfig:
     alert_channels: List[str] = field(default_factory=lambda: ["email"])
 
 
-@dataclass
+@dataclass(slots=True)
 class CostConfig:
     """Cost management layer configuration"""
 
@@ -157,8 +170,11 @@ class CostConfig:
     per_tenant_tracking: bool = False
     chargeback_enabled: bool = False
 
+    # Layer toggle
+    enabled: bool = True
 
-@dataclass
+
+@dataclass(slots=True)
 class FrameworkConfig:
     """Complete framework configuration"""
 
@@ -177,13 +193,20 @@ class FrameworkConfig:
     proxy_host: str = "0.0.0.0"
     proxy_port: int = 8000
     workers: int = 4
+    max_in_flight_per_connection: int = 32  # Pipelined requests handled concurrently
+    target_reply_timeout: Optional[float] = 300.0  # Seconds; None waits indefinitely
 
     def validate(self) -> bool:
-        """Validate configuration"""
+        """
+        Validate configuration
+
+        Runs once when EnterpriseProxy is constructed; it is not on the
+        request path.
+        """
         if not self.target_server:
             raise ValueError("target_server is required")
 
-        if self.security.tls_enabled:
+        if self.security.enabled and self.security.tls_enabled:
             if not self.security.tls_cert_path or not self.security.tls_key_path:
                 raise ValueError("TLS enabled but cert/key paths not provided")
 
@@ -2,6 +2,7 @@
 Cost management middleware implementation
 """
 
+import array
 import logging
 import time
 
@@ -10,6 +11,12 @@ from ..config import CostConfig
 
 logger = logging.getLogger(__name__)
 
+# Number of rate-limit slots; must be a power of two
+RATE_LIMIT_SLOTS = 4096
+
+# Length of a rate-limit window in seconds
+RATE_LIMIT_WINDOW = 60.0
+
 
 class CostManagementMiddleware(Middleware):
     """
@@ -21,45 +28,72 @@ class CostManagementMiddleware(Middleware):
     - Budget limits
     """
 
+    # May reject a request, but its rate-limit and budget checks read only
+    # request.user (set by security, which runs first) and its own state,
+    # never anything observability writes, so running the two concurrently
+    # cannot change the outcome
+    parallel_group = "telemetry"
+
     def __init__(self, config: CostConfig):
         self.config = config
-        self.usage_tracker = {}  # TODO: Implement persistent storage
+
+        # Fixed-size per-minute request counters, sharded by user hash.
+        # Users that hash to the same slot share a budget; memory stays
+        # bounded regardless of how many users are seen.
+        self._buckets = array.array('Q', [0] * RATE_LIMIT_SLOTS)
+        self._bucket_ts = array.array('d', [0.0] * RATE_LIMIT_SLOTS)
+
+        # Settings read on every request, resolved once
+        self._rl_enabled = config.rate_limits.enabled
+        self._rl_per_user = config.rate_limits.per_user
+        self._rl_limit = config.rate_limits.requests_per_minute
+        self._budget_enabled = config.budget.enabled
+        self._track_enabled = config.tracking_enabled
+
         logger.info("Cost management middleware initialized")
 
     async def process_request(self, request: Request) -> Request:
         """Process request through cost management layer"""
 
-        user = request.metadata.get("user", "anonymous")
-
         # 1. Check rate limits
-        if self.config.rate_limits.enabled:
-            if not await self._check_rate_limit(user):
-                raise PermissionError(f"Rate limit exceeded for user: {user}")
+        if self._rl_enabled:
+            if not self._check_rate_limit(request.user):
+                raise PermissionError(f"Rate limit exceeded for user: {request.user}")
 
         # 2. Check budget
-        if self.config.budget.enabled:
-            if not await self._check_budget(user):
-                raise PermissionError(f"Budget limit exceeded for user: {user}")
+        if self._budget_enabled:
+            if not await self._check_budget(request.user):
+                raise PermissionError(f"Budget limit exceeded for user: {request.user}")
 
         return request
 
     async def process_response(self, response: Response, request: Request) -> Response:
         """Process response through cost management layer"""
 
-        user = request.metadata.get("user", "anonymous")
-
         # Track usage
-        if self.config.tracking_enabled:
-            await self._track_usage(user, request, response)
+        if self._track_enabled:
+            await self._track_usage(request.user, request, response)
 
-        # Add cost info to response metadata
-        response.metadata["cost_usd"] = await self._calculate_cost(request, response)
+        # Add cost info to response
+        response.cost_usd = await self._calculate_cost(request, response)
 
         return response
 
-    async def _check_rate_limit(self, user: str) -> bool:
+    def _check_rate_limit(self, user: str) -> bool:
         """Check if user is within rate limits"""
-        # TODO: Implement actual rate limiting with Redis or similar
+        # TODO: Back with Redis or similar to share limits across workers
+        i = hash(user) & (RATE_LIMIT_SLOTS - 1) if self._rl_per_user else 0
+        now = time.monotonic()
+
+        if now - self._bucket_ts[i] > RATE_LIMIT_WINDOW:
+            self._bucket_ts[i] = now
+            self._buckets[i] = 1
+            return True
+
+        if self._buckets[i] >= self._rl_limit:
+            return False
+
+        self._buckets[i] += 1
         return True
 
     async def _check_budget(self, user: str) -> bool:
@@ -70,7 +104,7 @@ class CostManagementMiddleware(Middleware):
     async def _track_usage(self, user: str, request: Request, response: Response):
         """Track token/API usage"""
         # TODO: Implement usage tracking
-        logger.debug(f"Tracking usage for user: {user}, method: {request.method}")
+        logger.debug("Tracking usage for user: %s, method: %s", user, request.method)
 
     async def _calculate_cost(self, request: Request, response: Response) -> float:
         """Calculate cost of request"""
@@ -2,15 +2,23 @@
 Governance middleware implementation
 """
 
+import asyncio
 import logging
 import time
-from typing import Optional
+from typing import Dict, List, Optional
 
+from .._json import dumps_line as _ndjson_line
 from ..proxy.middleware import Middleware, Request, Response
-from ..config import GovernanceConfig
+from ..config import ApprovalConfig, GovernanceConfig
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of audit entries buffered before new ones are dropped
+AUDIT_QUEUE_SIZE = 10000
+
+# Maximum number of audit entries written per batch
+AUDIT_BATCH_SIZE = 500
+
 
 class GovernanceMiddleware(Middleware):
     """
@@ -24,6 +32,20 @@ class GovernanceMiddleware(Middleware):
 
     def __init__(self, config: GovernanceConfig):
         self.config = config
+
+        # Index approval rules by operation for O(1) lookup per request
+        # (first matching rule wins, as with the original scan)
+        self._op_to_approval: Dict[str, ApprovalConfig] = {}
+        for approval_config in config.approvals:
+            for op in approval_config.operations:
+                self._op_to_approval.setdefault(op, approval_config)
+
+        # Audit entries are buffered and written in batches by a background
+        # task, keeping storage I/O off the request path
+        self._audit_queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._audit_task: Optional[asyncio.Task] = None
+        self.audit_entries_dropped = 0
+
         logger.info("Governance middleware initialized")
 
     async def process_request(self, request: Request) -> Request:
@@ -34,7 +56,7 @@ class GovernanceMiddleware(Middleware):
             approval = await self._get_approval(request)
             if not approval:
                 raise PermissionError(f"Approval required for {request.method}")
-            request.metadata["approval"] = approval
+            request.approval = approval
 
         # 2. Audit log the request
         if self.config.audit.enabled:
@@ -56,11 +78,7 @@ class GovernanceMiddleware(Middleware):
 
     async def _requires_approval(self, request: Request) -> bool:
         """Check if request requires approval"""
-        # Check approval configurations
-        for approval_config in self.config.approvals:
-            if request.method in approval_config.operations:
-                return True
-        return False
+        return request.method in self._op_to_approval
 
     async def _get_approval(self, request: Request) -> Optional[str]:
         """
@@ -69,23 +87,71 @@ class GovernanceMiddleware(Middleware):
         Returns:
             Approval ID if approved, None otherwise
         """
+        approval_config = self._op_to_approval[request.method]
+
         # TODO: Implement actual approval workflow (Slack, Jira, Email)
         # For now, auto-approve
-        logger.warning(f"Auto-approving request: {request.method} (approval workflow not implemented)")
+        logger.warning("Auto-approving request: %s for rule '%s' (approval workflow not implemented)", request.method, approval_config.name)
         return "auto_approved"
 
     async def _audit_log(self, request: Request, event_type: str, response: Optional[Response] = None):
         """Write audit log entry"""
+        # Audit entries currently go to the log only, so skip building them
+        # when INFO is filtered out. Checked per call (the logger caches the
+        # answer) so logging configured after startup still takes effect.
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         audit_entry = {
             "event_type": event_type,
             "request_id": request.id,
             "method": request.method,
-            "user": request.metadata.get("user"),
-            "timestamp": time.time(),
+            "user": request.user,
+            "timestamp": time.time_ns(),
         }
 
         if response:
             audit_entry["status"] = "success" if not response.error else "error"
 
+        if self._audit_task is None:
+            self._audit_task = asyncio.create_task(self._audit_drain())
+
+        try:
+            self._audit_queue.put_nowait(audit_entry)
+        except asyncio.QueueFull:
+            self.audit_entries_dropped += 1
+
+    async def _audit_drain(self):
+        """Background task that writes buffered audit entries in batches"""
+        while True:
+            batch = [await self._audit_queue.get()]
+            while len(batch) < AUDIT_BATCH_SIZE and not self._audit_queue.empty():
+                batch.append(self._audit_queue.get_nowait())
+
+            try:
+                await self._write_audit_batch(batch)
+            except Exception as e:
+                logger.error("Error writing %d audit entries: %s", len(batch), e)
+
+    async def _write_audit_batch(self, batch: List[Dict]):
+        """Write a batch of audit entries as one NDJSON chunk"""
+        chunk = b"".join(_ndjson_line(entry) for entry in batch)
+
         # TODO: Write to configured audit storage (PostgreSQL, Elasticsearch, S3)
-        logger.info(f"Audit log: {audit_entry}")
+        logger.info("Audit log (%d entries):\n%s", len(batch), chunk.decode("utf-8"))
+
+    async def close(self):
+        """Stop the audit writer and flush any buffered entries"""
+        if self._audit_task is not None:
+            self._audit_task.cancel()
+            try:
+                await self._audit_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_task = None
+
+        batch = []
+        while not self._audit_queue.empty():
+            batch.append(self._audit_queue.get_nowait())
+        if batch:
+            await self._write_audit_batch(batch)
@@ -2,15 +2,36 @@
 Observability middleware implementation
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict
+from collections import Counter, defaultdict
+from typing import DefaultDict, Optional
 
 from ..proxy.middleware import Middleware, Request, Response
 from ..config import ObservabilityConfig
 
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds between pushes of the in-process counters to Prometheus
+METRICS_FLUSH_INTERVAL = 1.0
+
+if prometheus_client is not None:
+    REQUESTS_TOTAL = prometheus_client.Counter(
+        "mcp_requests_total", "MCP requests received", ["method"]
+    )
+    RESPONSES_TOTAL = prometheus_client.Counter(
+        "mcp_responses_total", "MCP responses returned", ["method", "status"]
+    )
+    RESPONSE_SECONDS_TOTAL = prometheus_client.Counter(
+        "mcp_response_seconds_total", "Total time spent serving MCP requests", ["method"]
+    )
+
 
 class ObservabilityMiddleware(Middleware):
     """
@@ -22,26 +43,52 @@ class ObservabilityMiddleware(Middleware):
     - Structured logs
     """
 
+    # Only annotates the request/response, so it can run alongside other
+    # telemetry middleware
+    parallel_group = "telemetry"
+
     def __init__(self, config: ObservabilityConfig):
         self.config = config
-        self.metrics = {}  # TODO: Implement Prometheus metrics
+
+        # Metrics are counted in plain dicts on the request path and
+        # pushed to Prometheus by a background task. Everything runs on the
+        # event loop thread, so increments need no locking.
+        # ObservabilityConfig(metrics=True) is the documented shorthand for
+        # a default MetricsConfig, so accept a bool as well
+        metrics = config.metrics
+        metrics_enabled = metrics if isinstance(metrics, bool) else metrics.enabled
+        self._metrics_enabled = metrics_enabled and prometheus_client is not None
+        if metrics_enabled and prometheus_client is None:
+            logger.warning("prometheus-client not installed; metrics disabled")
+        self._request_counts: Counter = Counter()
+        self._response_counts: Counter = Counter()
+        self._response_seconds: DefaultDict[str, float] = defaultdict(float)
+        self._flush_task: Optional[asyncio.Task] = None
+
         logger.info("Observability middleware initialized")
 
     async def process_request(self, request: Request) -> Request:
         """Process request through observability layer"""
 
-        # Start timing
-        request.metadata["start_time"] = time.time()
+        # Start timing (monotonic, integer nanoseconds)
+        request.start_ns = time.monotonic_ns()
+        request.timestamp = time.time()
 
-        # Log request
-        logger.info(f"Request: {request.method}", extra={
-            "method": request.method,
-            "request_id": request.id,
-            "timestamp": request.timestamp
-        })
+        # Log request (isEnabledFor is cached by the logger, and checking per
+        # call respects logging configured after startup)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Request: %s", request.method, extra={
+                "method": request.method,
+                "request_id": request.id,
+                "timestamp": request.timestamp
+            })
 
         # TODO: Start trace span
-        # TODO: Increment request counter metric
+
+        if self._metrics_enabled:
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_loop())
+            self._request_counts[request.method] += 1
 
         return request
 
@@ -49,20 +96,55 @@ class ObservabilityMiddleware(Middleware):
         """Process response through observability layer"""
 
         # Calculate duration
-        start_time = request.metadata.get("start_time", time.time())
-        duration = time.time() - start_time
+        if request.start_ns:
+            response.duration_ns = time.monotonic_ns() - request.start_ns
 
         # Log response
-        logger.info(f"Response: {request.method}", extra={
-            "method": request.method,
-            "request_id": request.id,
-            "duration_seconds": duration,
-            "status": "success" if not response.error else "error"
-        })
-
-        # TODO: Record metrics
-        # TODO: End trace span
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Response: %s", request.method, extra={
+                "method": request.method,
+                "request_id": request.id,
+                "duration_seconds": response.duration_ns / 1e9,
+                "status": "success" if not response.error else "error"
+            })
+
+        if self._metrics_enabled:
+            self._response_counts[request.method, "error" if response.error else "success"] += 1
+            self._response_seconds[request.method] += response.duration_ns / 1e9
 
-        response.metadata["duration_seconds"] = duration
+        # TODO: End trace span
 
         return response
+
+    async def _flush_loop(self):
+        """Push counted metrics to Prometheus every METRICS_FLUSH_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+            self._flush_metrics()
+
+    def _flush_metrics(self):
+        """Move the in-process counters into the Prometheus metrics"""
+        # Swap in fresh dicts so increments during the flush are kept
+        requests, self._request_counts = self._request_counts, Counter()
+        responses, self._response_counts = self._response_counts, Counter()
+        seconds, self._response_seconds = self._response_seconds, defaultdict(float)
+
+        for method, count in requests.items():
+            REQUESTS_TOTAL.labels(method).inc(count)
+        for (method, status), count in responses.items():
+            RESPONSES_TOTAL.labels(method, status).inc(count)
+        for method, total in seconds.items():
+            RESPONSE_SECONDS_TOTAL.labels(method).inc(total)
+
+    async def close(self):
+        """Stop the metrics flusher and push any remaining counts"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._metrics_enabled:
+            self._flush_metrics()
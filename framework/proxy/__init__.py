@@ -2,10 +2,14 @@
 MCP Proxy module
 """
 
-from .server import EnterpriseProxy, create_proxy
+from typing import TYPE_CHECKING
+
 from .middleware import Middleware, MiddlewareChain, Request, Response
 from .router import MCPRouter
 
+if TYPE_CHECKING:
+    from .server import EnterpriseProxy, create_proxy
+
 __all__ = [
     "EnterpriseProxy",
     "create_proxy",
@@ -15,3 +19,19 @@ __all__ = [
     "Response",
     "MCPRouter",
 ]
+
+
+def __getattr__(name: str):
+    # The server imports every middleware layer, and those layers import
+    # this package for the Middleware base class, so load it on first use
+    if name in ("EnterpriseProxy", "create_proxy"):
+        from . import server
+
+        value = getattr(server, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + ["EnterpriseProxy", "create_proxy"])
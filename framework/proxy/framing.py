@@ -0,0 +1,54 @@
+"""
+Message framing for MCP streams
+
+Messages are newline-delimited JSON, as in the MCP stdio transport: each
+message is one line of UTF-8 JSON terminated by a newline, with no
+embedded newlines.
+
+The proxy forwards a message's original bytes whenever no middleware
+changed it, so both hops deliberately share this one wire format. A
+binary encoding towards the target (MessagePack, FlatBuffers) would force
+a decode and re-encode of every message and a length-prefixed framing,
+and standard MCP servers only speak JSON.
+"""
+
+import asyncio
+
+# Largest message accepted on a stream; used as the StreamReader limit
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+async def read_message(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one message from a stream
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Message without its trailing newline, or b"" at end of stream
+
+    Raises:
+        asyncio.LimitOverrunError: If a message exceeds the reader's limit
+    """
+    while True:
+        try:
+            line = await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # Stream closed; a final unterminated message is still returned
+            return e.partial
+
+        message = line.rstrip(b"\r\n")
+        if message:
+            return message
+
+
+def write_message(writer: asyncio.StreamWriter, message: bytes):
+    """
+    Write one message to a stream
+
+    Args:
+        writer: Stream to write to
+        message: Serialized message, without a trailing newline
+    """
+    writer.writelines((message, b"\n"))
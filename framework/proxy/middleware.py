@@ -3,122 +3,10 @@ Middleware architecture for Enterprise MCP Framework
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Dict
-from dataclasses import dataclass, field
-import json
-import time
-import uuid
-
-
-@dataclass
-class Request:
-    """MCP Request model"""
-
-    method: str
-    params: Dict[str, Any]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    jsonrpc: str = "2.0"
-
-    # Metadata added by middleware
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> "Request":
-        """Parse request from bytes"""
-        try:
-            obj = json.loads(data.decode('utf-8'))
-            return cls(
-                method=obj.get("method", ""),
-                params=obj.get("params", {}),
-                id=obj.get("id", str(uuid.uuid4())),
-                jsonrpc=obj.get("jsonrpc", "2.0")
-            )
-        except Exception as e:
-            raise ValueError(f"Invalid MCP request: {e}")
-
-    def to_bytes(self) -> bytes:
-        """Convert request to bytes"""
-        obj = {
-            "jsonrpc": self.jsonrpc,
-            "method": self.method,
-            "params": self.params,
-            "id": self.id
-        }
-        return json.dumps(obj).encode('utf-8')
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            "jsonrpc": self.jsonrpc,
-            "method": self.method,
-            "params": self.params,
-            "id": self.id,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp
-        }
-
-
-@dataclass
-class Response:
-    """MCP Response model"""
-
-    result: Any = None
-    error: Optional[Dict[str, Any]] = None
-    id: Optional[str] = None
-    jsonrpc: str = "2.0"
-
-    # Metadata added by middleware
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> "Response":
-        """Parse response from bytes"""
-        try:
-            obj = json.loads(data.decode('utf-8'))
-            return cls(
-                result=obj.get("result"),
-                error=obj.get("error"),
-                id=obj.get("id"),
-                jsonrpc=obj.get("jsonrpc", "2.0")
-            )
-        except Exception as e:
-            raise ValueError(f"Invalid MCP response: {e}")
-
-    def to_bytes(self) -> bytes:
-        """Convert response to bytes"""
-        obj = {
-            "jsonrpc": self.jsonrpc,
-            "id": self.id
-        }
-        if self.error:
-            obj["error"] = self.error
-        else:
-            obj["result"] = self.result
-
-        return json.dumps(obj).encode('utf-8')
-
-    @classmethod
-    def error(cls, message: str, code: int = -32603) -> "Response":
-        """Create error response"""
-        return cls(
-            error={
-                "code": code,
-                "message": message
-            }
-        )
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            "jsonrpc": self.jsonrpc,
-            "id": self.id,
-            "result": self.result,
-            "error": self.error,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp
-        }
+import asyncio
+from typing import Optional, List, Awaitable, Callable, Tuple
+
+from .models import Request, Response
 
 
 class Middleware(ABC):
@@ -127,8 +15,14 @@ class Middleware(ABC):
 
     Middleware can intercept and modify requests and responses,
     add metadata, enforce policies, collect metrics, etc.
+
+    Adjacent middleware in the chain that share a non-None parallel_group
+    run concurrently. Only group middleware whose work is independent
+    and that update the request/response in place rather than replacing it.
     """
 
+    parallel_group: Optional[str] = None
+
     @abstractmethod
     async def process_request(self, request: Request) -> Request:
         """
@@ -171,23 +65,57 @@ class MiddlewareChain:
     in order: Security → Observability → Governance → Cost Management
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.middleware: List[Middleware] = []
 
+        # Bound handlers in call order, grouped into stages that run one
+        # after another; handlers within a stage run concurrently. Rebuilt
+        # on add() so the per-request path does no attribute lookups or
+        # reversed() allocation.
+        self._request_stages: Tuple[Tuple[Callable[[Request], Awaitable[Request]], ...], ...] = ()
+        self._response_stages: Tuple[Tuple[Callable[[Response, Request], Awaitable[Response]], ...], ...] = ()
+
     def add(self, middleware: Middleware):
         """Add middleware to chain"""
         self.middleware.append(middleware)
+        self._request_stages = self._build_stages(self.middleware, "process_request")
+        self._response_stages = self._build_stages(self.middleware[::-1], "process_response")
+
+    @staticmethod
+    def _build_stages(middleware: List[Middleware], method: str) -> Tuple[Tuple[Callable, ...], ...]:
+        """Group adjacent middleware with the same parallel_group into stages"""
+        stages: List[List[Callable]] = []
+        previous_group = None
+        for mw in middleware:
+            if mw.parallel_group is not None and mw.parallel_group == previous_group:
+                stages[-1].append(getattr(mw, method))
+            else:
+                stages.append([getattr(mw, method)])
+            previous_group = mw.parallel_group
+        return tuple(tuple(stage) for stage in stages)
 
     async def process_request(self, request: Request) -> Request:
         """Process request through all middleware"""
-        for mw in self.middleware:
-            request = await mw.process_request(request)
+        if not self._request_stages:
+            return request
+        for stage in self._request_stages:
+            if len(stage) == 1:
+                request = await stage[0](request)
+            else:
+                results = await asyncio.gather(*(handler(request) for handler in stage))
+                request = results[-1]
         return request
 
     async def process_response(self, response: Response, request: Request) -> Response:
         """Process response through all middleware (in reverse order)"""
-        for mw in reversed(self.middleware):
-            response = await mw.process_response(response, request)
+        if not self._response_stages:
+            return response
+        for stage in self._response_stages:
+            if len(stage) == 1:
+                response = await stage[0](response, request)
+            else:
+                results = await asyncio.gather(*(handler(response, request) for handler in stage))
+                response = results[-1]
         return response
 
     def __repr__(self) -> str:
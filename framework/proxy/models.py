@@ -0,0 +1,286 @@
+"""
+Request and response models for Enterprise MCP Framework
+
+Kept free of the middleware classes so that it can be compiled with mypyc
+(see setup.py); subclassing compiled classes from interpreted code is not
+supported, and middleware is meant to be subclassed.
+"""
+
+from typing import Optional, Any, Dict, Tuple
+from dataclasses import dataclass, field
+import itertools
+import logging
+import os
+
+from .._json import dumps as _dumps, loads as _loads
+
+logger = logging.getLogger(__name__)
+
+# Generated request ids: "<pid>-<counter>", unique within a process tree
+_id_counter = itertools.count(1)
+_id_prefix = f"{os.getpid()}-"
+
+
+def _reset_id_prefix():
+    global _id_prefix
+    _id_prefix = f"{os.getpid()}-"
+
+
+# Not available on Windows, where there is no fork to account for
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_prefix)
+
+
+def _next_id() -> str:
+    """Return a new request id without a urandom syscall or UUID formatting"""
+    return f"{_id_prefix}{next(_id_counter)}"
+
+
+# Fields that make up the wire message
+_REQUEST_WIRE_FIELDS = frozenset({"method", "params", "id", "jsonrpc", "notification"})
+_RESPONSE_WIRE_FIELDS = frozenset({"result", "error", "id", "jsonrpc"})
+
+# Pre-serialized error responses for the common JSON-RPC error codes;
+# only the id and message are encoded per error
+_ERROR_ID_PLACEHOLDER = b'"__ID__"'
+_ERROR_MESSAGE_PLACEHOLDER = b'"__MSG__"'
+
+
+def _error_template(code: int) -> Tuple[bytes, bytes, bytes]:
+    """Split an encoded error response around its id and message"""
+    encoded = _dumps({"jsonrpc": "2.0", "id": "__ID__", "error": {"code": code, "message": "__MSG__"}})
+    head, rest = encoded.split(_ERROR_ID_PLACEHOLDER)
+    middle, tail = rest.split(_ERROR_MESSAGE_PLACEHOLDER)
+    return head, middle, tail
+
+
+_ERROR_TEMPLATES: Dict[int, Tuple[bytes, bytes, bytes]] = {
+    code: _error_template(code) for code in (-32600, -32601, -32602, -32603)
+}
+
+
+class InvalidRequestError(ValueError):
+    """Valid JSON that is not a JSON-RPC request object (e.g. a batch array)"""
+
+
+@dataclass(slots=True)
+class Request:
+    """
+    MCP Request model
+
+    A request parsed by from_bytes keeps its original bytes, and to_bytes
+    returns them unchanged until one of method, params, id or jsonrpc is
+    reassigned. Middleware that edits params in place must go through
+    mutate() (request.mutate().params["key"] = value) for the change to
+    be forwarded.
+    """
+
+    method: str
+    params: Dict[str, Any]
+    id: Any = field(default_factory=_next_id)  # str or int on the wire
+    jsonrpc: str = "2.0"
+
+    # Metadata added by middleware
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0  # Wall-clock time, set by middleware that needs it
+
+    # Per-request state set by the built-in middleware
+    user: str = "anonymous"
+    approval: Optional[str] = None
+    start_ns: int = 0
+
+    # JSON-RPC notification: sent without an id, and the target sends no
+    # reply. id still holds a generated value for logging.
+    notification: bool = False
+
+    # Original wire bytes and whether a wire field changed since parsing
+    _raw: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in _REQUEST_WIRE_FIELDS:
+            object.__setattr__(self, "_dirty", True)
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Request":
+        """Parse request from bytes"""
+        try:
+            obj = _loads(data)
+            if not isinstance(obj, dict):
+                raise InvalidRequestError("Invalid Request")
+            request = cls(
+                method=obj.get("method", ""),
+                params=obj.get("params", {}),
+                id=obj["id"] if "id" in obj else _next_id(),
+                jsonrpc=obj.get("jsonrpc", "2.0"),
+                notification="id" not in obj
+            )
+        except InvalidRequestError:
+            logger.debug("MCP request is not an object: %r", data[:1024])
+            raise
+        except Exception as e:
+            # Keep the payload out of the exception, which reaches the client
+            logger.debug("Invalid MCP request (%s): %r", e, data[:1024])
+            raise ValueError("parse_error") from e
+
+        # Construction assigns every wire field, so reset the dirty flag
+        request._raw = data
+        request._dirty = False
+        return request
+
+    def mutate(self) -> "Request":
+        """Mark the request as changed before editing params in place"""
+        self._dirty = True
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Convert request to bytes"""
+        if self._raw is not None and not self._dirty:
+            return self._raw
+
+        # One encoder call over a small dict measured as fast as splicing
+        # prebuilt envelope bytes around separately encoded leaves with
+        # orjson, and about twice as fast with the stdlib fallback
+        obj: Dict[str, Any] = {
+            "jsonrpc": self.jsonrpc,
+            "method": self.method,
+            "params": self.params
+        }
+        if not self.notification:
+            obj["id"] = self.id
+        return _dumps(obj)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary
+
+        For debugging and diagnostics only; builds a new dict on every call.
+        Middleware on the request path should read attributes directly.
+        """
+        return {
+            "jsonrpc": self.jsonrpc,
+            "method": self.method,
+            "params": self.params,
+            "id": self.id,
+            "metadata": self.metadata,
+            "timestamp": self.timestamp,
+            "user": self.user,
+            "approval": self.approval,
+            "notification": self.notification
+        }
+
+
+@dataclass(slots=True)
+class Response:
+    """
+    MCP Response model
+
+    A response parsed by from_bytes keeps its original bytes, and to_bytes
+    returns them unchanged until one of result, error, id or jsonrpc is
+    reassigned. Middleware that edits result in place must go through
+    mutate() (response.mutate().result["key"] = value) for the change to
+    be returned.
+    """
+
+    result: Any = None
+    error: Optional[Dict[str, Any]] = None
+    id: Any = None
+    jsonrpc: str = "2.0"
+
+    # Metadata added by middleware
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0  # Wall-clock time, set by middleware that needs it
+
+    # Per-response state set by the built-in middleware
+    duration_ns: int = 0
+    cost_usd: float = 0.0
+
+    # Original wire bytes and whether a wire field changed since parsing
+    _raw: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in _RESPONSE_WIRE_FIELDS:
+            object.__setattr__(self, "_dirty", True)
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Response":
+        """Parse response from bytes"""
+        try:
+            obj = _loads(data)
+            response = cls(
+                result=obj.get("result"),
+                error=obj.get("error"),
+                id=obj.get("id"),
+                jsonrpc=obj.get("jsonrpc", "2.0")
+            )
+        except Exception as e:
+            logger.debug("Invalid MCP response (%s): %r", e, data[:1024])
+            raise ValueError("parse_error") from e
+
+        # Construction assigns every wire field, so reset the dirty flag
+        response._raw = data
+        response._dirty = False
+        return response
+
+    def mutate(self) -> "Response":
+        """Mark the response as changed before editing result or error in place"""
+        self._dirty = True
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Convert response to bytes"""
+        if self._raw is not None and not self._dirty:
+            return self._raw
+
+        # Single encoder call; see Request.to_bytes
+        obj: Dict[str, Any] = {
+            "jsonrpc": self.jsonrpc,
+            "id": self.id
+        }
+        if self.error:
+            obj["error"] = self.error
+        else:
+            obj["result"] = self.result
+
+        return _dumps(obj)
+
+    @classmethod
+    def from_error(cls, message: str, code: int = -32603, request_id: Any = None) -> "Response":
+        """Create error response"""
+        return cls(
+            error={
+                "code": code,
+                "message": message
+            },
+            id=request_id
+        )
+
+    @classmethod
+    def error_bytes(cls, message: str, code: int = -32603, request_id: Any = None) -> bytes:
+        """Serialize an error response without constructing a Response"""
+        template = _ERROR_TEMPLATES.get(code)
+        if template is None:
+            return cls.from_error(message, code, request_id).to_bytes()
+        head, middle, tail = template
+        return b"".join((head, _dumps(request_id), middle, _dumps(message), tail))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary
+
+        For debugging and diagnostics only; builds a new dict on every call.
+        Middleware on the request path should read attributes directly.
+        """
+        return {
+            "jsonrpc": self.jsonrpc,
+            "id": self.id,
+            "result": self.result,
+            "error": self.error,
+            "metadata": self.metadata,
+            "timestamp": self.timestamp,
+            "duration_seconds": self.duration_ns / 1e9,
+            "cost_usd": self.cost_usd
+        }
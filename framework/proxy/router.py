@@ -4,10 +4,20 @@ MCP Router for forwarding requests to target servers
 
 import asyncio
 import logging
-from typing import Optional
+import socket
+import time
+from typing import Any, List, Optional, Tuple
+
+from .._json import loads
+from .framing import MAX_MESSAGE_SIZE, read_message, write_message
 
 logger = logging.getLogger(__name__)
 
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+# Seconds a resolved target address is reused before resolving again
+ADDRESS_CACHE_TTL = 300.0
+
 
 class MCPRouter:
     """
@@ -16,26 +26,57 @@ class MCPRouter:
     Handles connection pooling, retries, and failover
     """
 
-    def __init__(self, target_host: str, target_port: int):
+    def __init__(
+        self,
+        target_host: str,
+        target_port: int,
+        max_keepalive_connections: int = 100,
+        max_connections: int = 200,
+        reply_timeout: Optional[float] = 300.0,
+    ):
         """
         Initialize router
 
         Args:
             target_host: Target MCP server host
             target_port: Target MCP server port
+            max_keepalive_connections: Idle connections kept open for reuse
+            max_connections: Connections open to the target at once
+            reply_timeout: Seconds to wait for the target's reply before
+                giving up on a request (None waits indefinitely)
         """
         self.target_host = target_host
         self.target_port = target_port
-        self.connection_pool = None  # TODO: Implement connection pooling
+        self.reply_timeout = reply_timeout
 
-        logger.info(f"MCP Router initialized: {target_host}:{target_port}")
+        # Idle keep-alive connections, reused across requests
+        self._pool: asyncio.Queue = asyncio.Queue(maxsize=max_keepalive_connections)
+        self._connection_limit = asyncio.Semaphore(max_connections)
 
-    async def forward(self, data: bytes) -> bytes:
+        # Resolved target addresses, so new connections skip getaddrinfo
+        self._addresses: Optional[List[Tuple[Any, ...]]] = None
+        self._addresses_expire = 0.0
+
+        logger.info("MCP Router initialized: %s:%s", target_host, target_port)
+
+    async def forward(self, data: bytes, request_id: Any) -> bytes:
         """
         Forward request to target MCP server
 
+        Uses a pooled keep-alive connection when one is idle. If writing to
+        a pooled connection fails, it is discarded and the request is sent
+        on another one; once the request has been written it is never
+        retried, since tool calls need not be idempotent.
+
+        Messages from the target other than the reply to this request
+        (notifications and server-initiated requests) are dropped. A
+        connection that carried a stray reply to some other request is
+        closed rather than pooled. If no reply arrives within reply_timeout
+        the request fails and the connection is closed.
+
         Args:
             data: Raw MCP request
+            request_id: The request's JSON-RPC id, matched against replies
 
         Returns:
             Raw MCP response
@@ -44,29 +85,192 @@ class MCPRouter:
             Exception: If forwarding fails
         """
         try:
-            # Open connection to target server
-            reader, writer = await asyncio.open_connection(
-                self.target_host,
-                self.target_port
-            )
+            async with self._connection_limit:
+                while True:
+                    connection, reused = await self._acquire()
+                    try:
+                        # Send request
+                        write_message(connection[1], data)
+                        await connection[1].drain()
+                    except OSError:
+                        self._discard(connection)
+                        if reused:
+                            continue
+                        raise
+                    except BaseException:
+                        self._discard(connection)
+                        raise
+                    break
 
-            # Send request
-            writer.write(data)
-            await writer.drain()
+                reusable = False
+                try:
+                    # Read response
+                    response, reusable = await asyncio.wait_for(
+                        self._read_reply(connection[0], request_id),
+                        self.reply_timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"No reply from target within {self.reply_timeout}s") from None
+                finally:
+                    if reusable:
+                        self._release(connection)
+                    else:
+                        self._discard(connection)
+                return response
 
-            # Read response
-            response = await reader.read(4096)
+        except Exception as e:
+            logger.error("Error forwarding request to %s:%s: %s", self.target_host, self.target_port, e)
+            raise
 
-            # Close connection
-            writer.close()
-            await writer.wait_closed()
+    async def send(self, data: bytes):
+        """
+        Send a notification to the target MCP server without awaiting a reply
+
+        JSON-RPC notifications carry no id and are never answered, so the
+        connection goes straight back to the pool once the message is
+        written.
 
-            return response
+        Args:
+            data: Raw MCP notification
+
+        Raises:
+            Exception: If sending fails
+        """
+        try:
+            async with self._connection_limit:
+                while True:
+                    connection, reused = await self._acquire()
+                    try:
+                        write_message(connection[1], data)
+                        await connection[1].drain()
+                    except OSError:
+                        self._discard(connection)
+                        if reused:
+                            continue
+                        raise
+                    except BaseException:
+                        self._discard(connection)
+                        raise
+                    self._release(connection)
+                    return
 
         except Exception as e:
-            logger.error(f"Error forwarding request to {self.target_host}:{self.target_port}: {e}")
+            logger.error("Error sending notification to %s:%s: %s", self.target_host, self.target_port, e)
             raise
 
+    async def _read_reply(self, reader: asyncio.StreamReader, request_id: Any) -> Tuple[bytes, bool]:
+        """
+        Read messages until the reply to request_id arrives
+
+        Returns:
+            The reply, and whether the connection is still fit for reuse
+        """
+        reusable = True
+        while True:
+            message = await read_message(reader)
+            if not message:
+                raise ConnectionError("Target closed the connection before replying")
+
+            try:
+                obj = loads(message)
+            except ValueError:
+                obj = None
+            if not isinstance(obj, dict):
+                logger.debug("Dropping malformed message from target: %r", message[:1024])
+                reusable = False
+                continue
+
+            if "method" in obj:
+                # Notification or server-initiated request; there is no
+                # client-side handler to route it to
+                logger.debug("Dropping %s message from target", obj["method"])
+                continue
+
+            reply_id = obj.get("id")
+            if reply_id == request_id:
+                return message, reusable
+
+            if reply_id is None and "error" in obj:
+                # Parse error and Invalid Request replies carry a null id.
+                # A connection has one request outstanding, so this is the
+                # reply to it; the target's state is unknown, so don't pool.
+                return message, False
+
+            # A reply meant for an earlier request on this connection
+            logger.debug("Dropping reply with unexpected id %r from target", obj.get("id"))
+            reusable = False
+
+    async def _acquire(self) -> Tuple[Connection, bool]:
+        """Take an idle pooled connection, or open a new one"""
+        while not self._pool.empty():
+            connection = self._pool.get_nowait()
+            if connection[0].at_eof() or connection[1].is_closing():
+                self._discard(connection)
+                continue
+            return connection, True
+
+        sock = await self._connect()
+        connection = await asyncio.open_connection(sock=sock, limit=MAX_MESSAGE_SIZE)
+        return connection, False
+
+    async def _resolve(self) -> List[Tuple[Any, ...]]:
+        """Return the target's addresses, resolving at most every ADDRESS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._addresses is None or now >= self._addresses_expire:
+            loop = asyncio.get_running_loop()
+            self._addresses = await loop.getaddrinfo(
+                self.target_host,
+                self.target_port,
+                type=socket.SOCK_STREAM
+            )
+            self._addresses_expire = now + ADDRESS_CACHE_TTL
+        return self._addresses
+
+    async def _connect(self) -> socket.socket:
+        """Open a connected socket to the first reachable target address"""
+        loop = asyncio.get_running_loop()
+        error: Optional[OSError] = None
+        for family, type_, proto, _, address in await self._resolve():
+            sock = socket.socket(family, type_, proto)
+            try:
+                sock.setblocking(False)
+                # asyncio only sets this itself when proto is IPPROTO_TCP
+                if family in (socket.AF_INET, socket.AF_INET6):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                await loop.sock_connect(sock, address)
+                return sock
+            except OSError as e:
+                sock.close()
+                error = e
+            except BaseException:
+                sock.close()
+                raise
+
+        # The target may have moved; resolve again on the next attempt
+        self._addresses = None
+        raise error or OSError(f"No addresses found for {self.target_host}")
+
+    def _release(self, connection: Connection):
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            self._pool.put_nowait(connection)
+        except asyncio.QueueFull:
+            self._discard(connection)
+
+    def _discard(self, connection: Connection):
+        """Close a connection without returning it to the pool"""
+        connection[1].close()
+
+    async def close(self):
+        """Close all idle pooled connections"""
+        while not self._pool.empty():
+            _, writer = self._pool.get_nowait()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
     async def health_check(self) -> bool:
         """
         Check if target server is healthy
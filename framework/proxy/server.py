@@ -5,11 +5,13 @@ Transparent proxy that adds enterprise features to any MCP server
 
 import asyncio
 import logging
-from typing import Optional, Any, Dict
-import json
+from typing import Optional, Any, Awaitable, Callable, List
 
+from .._json import loads
 from ..config import FrameworkConfig, SecurityConfig, ObservabilityConfig, GovernanceConfig, CostConfig
+from .framing import MAX_MESSAGE_SIZE, read_message, write_message
 from .middleware import MiddlewareChain, Request, Response
+from .models import InvalidRequestError
 from .router import MCPRouter
 
 # Middleware imports
@@ -18,8 +20,16 @@ from ..observability.middleware import ObservabilityMiddleware
 from ..governance.middleware import GovernanceMiddleware
 from ..cost_management.middleware import CostManagementMiddleware
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Longest exception message copied into a client-facing error response
+MAX_ERROR_MESSAGE_LENGTH = 256
+
 
 class EnterpriseProxy:
     """
@@ -79,10 +89,16 @@ class EnterpriseProxy:
         self.config.validate()
 
         # Initialize components
-        self.router = MCPRouter(target_host, target_port)
+        self._shutdown_callbacks: List[Callable[[], Awaitable[Any]]] = []
+        self.router = MCPRouter(
+            target_host,
+            target_port,
+            reply_timeout=self.config.target_reply_timeout
+        )
+        self.on_shutdown(self.router.close)
         self.middleware = self._init_middleware()
 
-        logger.info(f"Enterprise MCP Proxy initialized for {target_server}")
+        logger.info("Enterprise MCP Proxy initialized for %s", target_server)
 
     def _init_middleware(self) -> MiddlewareChain:
         """Initialize middleware chain"""
@@ -92,28 +108,32 @@ class EnterpriseProxy:
         # Security → Observability → Governance → Cost Management
 
         # 1. Security layer (auth, RBAC, encryption)
-        if self.config.security:
+        if self.config.security and self.config.security.enabled:
             chain.add(SecurityMiddleware(self.config.security))
             logger.info("Security middleware enabled")
 
         # 2. Observability layer (metrics, tracing, logging)
-        if self.config.observability:
-            chain.add(ObservabilityMiddleware(self.config.observability))
+        if self.config.observability and self.config.observability.enabled:
+            observability = ObservabilityMiddleware(self.config.observability)
+            chain.add(observability)
+            self.on_shutdown(observability.close)
             logger.info("Observability middleware enabled")
 
         # 3. Governance layer (approvals, audit, policies)
-        if self.config.governance:
-            chain.add(GovernanceMiddleware(self.config.governance))
+        if self.config.governance and self.config.governance.enabled:
+            governance = GovernanceMiddleware(self.config.governance)
+            chain.add(governance)
+            self.on_shutdown(governance.close)
             logger.info("Governance middleware enabled")
 
         # 4. Cost management layer (tracking, limits, budgets)
-        if self.config.cost_management:
+        if self.config.cost_management and self.config.cost_management.enabled:
             chain.add(CostManagementMiddleware(self.config.cost_management))
             logger.info("Cost management middleware enabled")
 
         return chain
 
-    async def handle_request(self, raw_request: bytes) -> bytes:
+    async def handle_request(self, raw_request: bytes) -> Optional[bytes]:
         """
         Handle MCP request through middleware chain
 
@@ -121,19 +141,42 @@ class EnterpriseProxy:
             raw_request: Raw MCP protocol request
 
         Returns:
-            Raw MCP protocol response
+            Raw MCP protocol response, or None for a notification, which
+            gets no response
         """
+        notification = False
+        request_id = None
         try:
+            # With every layer disabled the proxy is a pure byte relay
+            if not self.middleware.middleware:
+                obj = loads(raw_request)
+                if not isinstance(obj, dict):
+                    # e.g. a batch array, which the proxy does not support
+                    raise InvalidRequestError("Invalid Request")
+                if "id" not in obj:
+                    notification = True
+                    await self.router.send(raw_request)
+                    return None
+                request_id = obj["id"]
+                return await self.router.forward(raw_request, request_id)
+
             # Parse MCP request
             request = Request.from_bytes(raw_request)
+            notification = request.notification
+            request_id = request.id
 
-            logger.debug(f"Processing request: {request.method}")
+            logger.debug("Processing request: %s", request.method)
 
             # Process through middleware chain
             processed_request = await self.middleware.process_request(request)
 
+            # Notifications are passed on; the target sends no reply
+            if processed_request.notification:
+                await self.router.send(processed_request.to_bytes())
+                return None
+
             # Forward to target MCP server
-            raw_response = await self.router.forward(processed_request.to_bytes())
+            raw_response = await self.router.forward(processed_request.to_bytes(), processed_request.id)
 
             # Parse response
             response = Response.from_bytes(raw_response)
@@ -143,11 +186,19 @@ class EnterpriseProxy:
 
             return processed_response.to_bytes()
 
+        except InvalidRequestError:
+            logger.warning("Rejected message that is not a JSON-RPC request object")
+            return Response.error_bytes("Invalid Request", -32600)
+
         except Exception as e:
-            logger.error(f"Error handling request: {e}", exc_info=True)
-            # Return error response
-            error_response = Response.error(str(e))
-            return error_response.to_bytes()
+            message = f"{type(e).__name__}: {str(e)[:MAX_ERROR_MESSAGE_LENGTH]}"
+            logger.error("Error handling request: %s", message, exc_info=True)
+            # JSON-RPC never answers a notification, even with an error
+            if notification:
+                return None
+            # Return error response, with the id so pipelined clients can
+            # tell which request failed
+            return Response.error_bytes(message, request_id=request_id)
 
     def start(self):
         """
@@ -156,11 +207,14 @@ class EnterpriseProxy:
         This starts an async server that listens for MCP protocol connections
         and proxies them through the middleware chain to the target server.
         """
-        logger.info(f"Starting Enterprise MCP Proxy on {self.config.proxy_host}:{self.config.proxy_port}")
-        logger.info(f"Target server: {self.config.target_server} at {self.config.target_host}:{self.config.target_port}")
+        logger.info("Starting Enterprise MCP Proxy on %s:%s", self.config.proxy_host, self.config.proxy_port)
+        logger.info("Target server: %s at %s:%s", self.config.target_server, self.config.target_host, self.config.target_port)
 
-        # Start async event loop
-        asyncio.run(self._run_server())
+        # Start async event loop (libuv-based when uvloop is installed)
+        if uvloop is not None:
+            uvloop.run(self._run_server())
+        else:
+            asyncio.run(self._run_server())
 
     async def _run_server(self):
         """Run the proxy server"""
@@ -168,41 +222,84 @@ class EnterpriseProxy:
         server = await asyncio.start_server(
             self._handle_connection,
             self.config.proxy_host,
-            self.config.proxy_port
+            self.config.proxy_port,
+            limit=MAX_MESSAGE_SIZE
         )
 
         addr = server.sockets[0].getsockname()
-        logger.info(f"Proxy server listening on {addr}")
+        logger.info("Proxy server listening on %s", addr)
 
-        async with server:
-            await server.serve_forever()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for callback in self._shutdown_callbacks:
+                try:
+                    await callback()
+                except Exception as e:
+                    logger.error("Error in shutdown callback %r: %s", callback, e)
 
     async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle individual client connection"""
+        """
+        Handle individual client connection
+
+        Requests are read as they arrive and handled concurrently, up to
+        max_in_flight_per_connection at a time. Responses are written as
+        they complete, so they may be out of request order; clients match
+        them to requests by id.
+        """
         addr = writer.get_extra_info('peername')
-        logger.debug(f"Connection from {addr}")
+        logger.debug("Connection from %s", addr)
+
+        in_flight = asyncio.Semaphore(self.config.max_in_flight_per_connection)
+        tasks = set()
 
         try:
             while True:
                 # Read request
-                data = await reader.read(4096)
+                data = await read_message(reader)
                 if not data:
                     break
 
-                # Process through enterprise layers
-                response = await self.handle_request(data)
-
-                # Send response
-                writer.write(response)
-                await writer.drain()
+                # Process through enterprise layers without blocking the reader
+                await in_flight.acquire()
+                task = asyncio.create_task(self._respond(data, writer, in_flight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
 
         except Exception as e:
-            logger.error(f"Error handling connection from {addr}: {e}")
+            logger.error("Error handling connection from %s: %s", addr, e)
 
         finally:
+            # Let requests already read finish before closing the connection
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
             writer.close()
             await writer.wait_closed()
-            logger.debug(f"Connection closed: {addr}")
+            logger.debug("Connection closed: %s", addr)
+
+    async def _respond(self, data: bytes, writer: asyncio.StreamWriter, in_flight: asyncio.Semaphore):
+        """Handle one pipelined request and send its response"""
+        try:
+            response = await self.handle_request(data)
+
+            # Send response
+            if response is not None:
+                write_message(writer, response)
+                await writer.drain()
+        except Exception as e:
+            logger.debug("Error sending response: %s", e)
+        finally:
+            in_flight.release()
+
+    def on_shutdown(self, callback: Callable[[], Awaitable[Any]]):
+        """
+        Register a coroutine function to run when the server shuts down
+
+        Callbacks run on the proxy's event loop, in registration order,
+        after the listener has stopped accepting connections.
+        """
+        self._shutdown_callbacks.append(callback)
 
     def stop(self):
         """Stop the proxy server"""
@@ -3,13 +3,17 @@ Security middleware implementation
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 
 from ..proxy.middleware import Middleware, Request, Response
 from ..config import SecurityConfig
 
 logger = logging.getLogger(__name__)
 
+# Most (user, operation) RBAC decisions kept at once
+RBAC_CACHE_SIZE = 10000
+
 
 class SecurityMiddleware(Middleware):
     """
@@ -24,7 +28,12 @@ class SecurityMiddleware(Middleware):
 
     def __init__(self, config: SecurityConfig):
         self.config = config
-        logger.info(f"Security middleware initialized with {config.auth_provider}")
+
+        # (user, operation) -> (monotonic deadline, allowed)
+        self._rbac_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+        self._rbac_cache_ttl = config.rbac_cache_ttl_seconds
+
+        logger.info("Security middleware initialized with %s", config.auth_provider)
 
     async def process_request(self, request: Request) -> Request:
         """Process request through security layer"""
@@ -34,17 +43,17 @@ class SecurityMiddleware(Middleware):
         if not user:
             raise PermissionError("Authentication failed")
 
-        request.metadata["user"] = user
+        request.user = user
 
         # 2. Authorization (RBAC)
         if self.config.rbac_enabled:
-            if not await self._authorize(user, request.method):
+            if not await self._authorize_cached(user, request.method):
                 raise PermissionError(f"User {user} not authorized for {request.method}")
 
         # 3. Encryption (decrypt if needed)
         # TODO: Implement encryption/decryption
 
-        logger.debug(f"Security check passed for user: {user}")
+        logger.debug("Security check passed for user: %s", user)
         return request
 
     async def process_response(self, response: Response, request: Request) -> Response:
@@ -55,6 +64,29 @@ class SecurityMiddleware(Middleware):
 
         return response
 
+    def invalidate_authorization_cache(self):
+        """Drop cached RBAC decisions, e.g. after roles are reloaded"""
+        self._rbac_cache.clear()
+
+    async def _authorize_cached(self, user: str, operation: str) -> bool:
+        """Check authorization, reusing a recent decision for the same user and operation"""
+        if self._rbac_cache_ttl <= 0:
+            return await self._authorize(user, operation)
+
+        key = (user, operation)
+        now = time.monotonic()
+        cached = self._rbac_cache.get(key)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        allowed = await self._authorize(user, operation)
+
+        if cached is None and len(self._rbac_cache) >= RBAC_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del self._rbac_cache[next(iter(self._rbac_cache))]
+        self._rbac_cache[key] = (now + self._rbac_cache_ttl, allowed)
+        return allowed
+
     async def _authenticate(self, request: Request) -> Optional[str]:
         """
         Authenticate user from request
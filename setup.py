@@ -2,11 +2,23 @@
 Enterprise MCP Framework setup
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Opt-in: ENTERPRISE_MCP_MYPYC=1 compiles the request/response models to a
+# C extension with mypyc (needs mypy at build time). Without it, or where
+# no compiled wheel exists, the same modules run as pure Python.
+ext_modules = []
+if os.environ.get("ENTERPRISE_MCP_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Optional dependencies (uvloop, prometheus-client) may be absent
+    ext_modules = mypycify(["--ignore-missing-imports", "framework/proxy/models.py"])
+
 setup(
     name="enterprise-mcp-framework",
     version="0.1.0",
@@ -17,6 +29,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/cogniolab/enterprise-mcp-framework",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -51,5 +64,9 @@ setup(
             "cryptography>=41.0.0",
             "pyjwt>=2.8.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+        ],
     },
 )